@@ -0,0 +1,45 @@
+"""add job description rank index to matches
+
+Revision ID: 3b9e6f1c2d47
+Revises: 
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9e6f1c2d47'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases built by create_all after the model gained this constraint already have it
+    existing = {constraint["name"] for constraint in sa.inspect(op.get_bind()).get_unique_constraints("matches")}
+    if "uq_matches_job_description_rank" in existing:
+        return
+    # POST /match-result could create several rows with the same rank for a job; keep the newest of each
+    op.execute(
+        "DELETE older FROM matches AS older "
+        "JOIN matches AS newer ON older.job_description_id = newer.job_description_id "
+        "AND older.`rank` = newer.`rank` AND older.id < newer.id"
+    )
+    op.create_unique_constraint(
+        "uq_matches_job_description_rank", "matches", ["job_description_id", "rank"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # MySQL may have dropped its own foreign key index in favour of the composite one; the foreign key
+    # needs an index on job_description_id before the composite index can go
+    indexes = {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("matches")}
+    if "ix_matches_job_description_id" not in indexes:
+        op.create_index("ix_matches_job_description_id", "matches", ["job_description_id"])
+    op.drop_constraint("uq_matches_job_description_rank", "matches", type_="unique")
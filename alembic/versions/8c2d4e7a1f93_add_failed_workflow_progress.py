@@ -0,0 +1,41 @@
+"""add failed workflow progress
+
+Revision ID: 8c2d4e7a1f93
+Revises: 3b9e6f1c2d47
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2d4e7a1f93'
+down_revision: Union[str, Sequence[str], None] = '3b9e6f1c2d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "workflow_statuses",
+        "progress",
+        existing_type=sa.Enum("PENDING", "PROCESSING", "COMPLETED", name="workflowprogressenum"),
+        type_=sa.Enum("PENDING", "PROCESSING", "COMPLETED", "FAILED", name="workflowprogressenum"),
+        existing_nullable=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("UPDATE workflow_statuses SET progress = 'PROCESSING' WHERE progress = 'FAILED'")
+    op.alter_column(
+        "workflow_statuses",
+        "progress",
+        existing_type=sa.Enum("PENDING", "PROCESSING", "COMPLETED", "FAILED", name="workflowprogressenum"),
+        type_=sa.Enum("PENDING", "PROCESSING", "COMPLETED", name="workflowprogressenum"),
+        existing_nullable=True,
+    )
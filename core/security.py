@@ -19,7 +19,7 @@ Oauth2_bearer = OAuth2PasswordBearer(tokenUrl="/api/user/token")
 
 
 
-async def authenticate_user(email: str, password: str, db: db_dependency):
+def authenticate_user(email: str, password: str, db: db_dependency):
     user = db.query(user_model).filter(user_model.email == email).first()
     if not user:
         return False
@@ -34,7 +34,7 @@ def hashing_password(password: str):
     return password
 
 
-async def create_access_token(email: str, user_id: int, expires_delta: timedelta, db: db_dependency):
+def create_access_token(email: str, user_id: int, expires_delta: timedelta, db: db_dependency):
     from crud.user import get_user_by_id
     user = get_user_by_id(user_id,db)
     encode = {'sub': email, 'id': user_id, 'role': user.role.value}
@@ -23,7 +23,7 @@ def get_all_job_descriptions(db: db_dependency) -> list[JobDescriptionRequestorO
 def get_job_description_by_id(db: db_dependency, id: int) -> JobDescriptionRequest:
     try:
         logger.debug(f"Fetching job description with ID: {id}.")
-        result = db.query(JobDescription).filter(JobDescription.id == id).first()
+        result = db.get(JobDescription, id)
         if not result:
             logger.warning(f"Job description with ID {id} not found.")
             raise HTTPException(
@@ -96,7 +96,7 @@ def update_job_description_by_id(db: db_dependency, id: int,
                                  job_description_request: JobDescriptionRequest) -> JobDescriptionRequest:
     try:
         logger.debug(f"Attempting to update job description with ID: {id}.")
-        result = db.query(JobDescription).filter(JobDescription.id == id).first()
+        result = db.get(JobDescription, id)
         if not result:
             logger.warning(f"Job description with ID {id} not found for update.")
             raise HTTPException(
@@ -122,7 +122,7 @@ def update_job_description_by_id(db: db_dependency, id: int,
 def delete_job_description_by_id(db: db_dependency, id: int) -> None:
     try:
         logger.debug(f"Attempting to delete job description with ID: {id}.")
-        result = db.query(JobDescription).filter(JobDescription.id == id).first()
+        result = db.get(JobDescription, id)
         if not result:
             logger.warning(f"Job description with ID {id} not found for deletion.")
             raise HTTPException(
@@ -145,7 +145,7 @@ def delete_job_description_by_id(db: db_dependency, id: int) -> None:
 def update_job_description_status(db: db_dependency, id: int, notification_status: str) -> JobDescriptionRequest:
     try:
         logger.debug(f"Attempting to update status of job description with ID: {id} to {notification_status}.")
-        result = db.query(JobDescription).filter(JobDescription.id == id).first()
+        result = db.get(JobDescription, id)
         if not result:
             logger.warning(f"Job description with ID {id} not found for status update.")
             raise HTTPException(
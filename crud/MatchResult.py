@@ -1,5 +1,8 @@
-from fastapi import HTTPException, status
-from db.database import db_dependency
+from fastapi import BackgroundTasks, HTTPException, status
+from sqlalchemy import event, lambda_stmt, select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session, object_session
+from db.database import db_dependency, sessionLocal
 from model.MatchResult import MatchResult  # Assuming this is the ORM model
 from schema.MatchResult import MatchResultSchema
 from model.JobDescription import JobDescription
@@ -7,97 +10,267 @@ from model.ConsultantProfile import ConsultantProfile, ConsultantEnum
 from model.WorkflowStatus import WorkflowStatus, WorkflowProgressEnum
 from model.Notification import Notification, NotificationStatusEnum
 from utility.agentic_flow import run_agent_matching
-from utility.send_email import send_email
+from crud.Notification import send_pending_notifications
+from utility.cache import get_cached, set_cached, invalidate_top_matches, invalidate_all_top_matches, top_matches_key, \
+    LocalTTLCache
+from typing import Iterator
+from pydantic import TypeAdapter
 import logging
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Column-only selections for read paths, so rows come back as plain tuples instead of ORM instances
+MATCH_RESULT_COLUMNS = (
+    MatchResult.job_description_id,
+    MatchResult.consultant_id,
+    MatchResult.similarity_score,
+    MatchResult.rank,
+    MatchResult.matched_at,
+)
+TOP_MATCH_COLUMNS = (
+    MatchResult.similarity_score,
+    MatchResult.rank,
+    MatchResult.matched_at,
+    ConsultantProfile.id.label("consultant_id"),
+    ConsultantProfile.name,
+    ConsultantProfile.skills,
+    ConsultantProfile.experience,
+    ConsultantProfile.location,
+    ConsultantProfile.availability,
+)
 
-def get_all_match_results(db: db_dependency, jobDescription_id: int):
-    try:
-        logger.debug("Fetching all match results from the database.")
-        jd = db.query(JobDescription).filter(JobDescription.id == jobDescription_id).first()
+
+# Validates whole batches of rows in pydantic-core instead of one model_validate call per row
+MATCH_LIST_ADAPTER = TypeAdapter(list[MatchResultSchema])
+
+# Rows fetched per round-trip when streaming match results
+STREAM_BATCH_SIZE = 200
+
+
+# Process-local caches for the reads that start every matching workflow. Entries are detached,
+# fully loaded instances, and are dropped once a transaction that changed the rows commits.
+job_description_cache = LocalTTLCache(maxsize=1024, ttl=60)
+available_profiles_cache = LocalTTLCache(maxsize=1, ttl=60)
+
+
+def get_cached_job_description(db: db_dependency, jobDescription_id: int):
+    jd = job_description_cache.get(jobDescription_id)
+    if jd is None:
+        jd = db.get(JobDescription, jobDescription_id)
+        if jd is not None:
+            # Expunging detaches the instance with its attributes loaded, so later commits cannot expire it
+            db.expunge(jd)
+            job_description_cache.set(jobDescription_id, jd)
+    return jd
+
+
+def get_cached_available_profiles(db: db_dependency) -> list:
+    profiles = available_profiles_cache.get(ConsultantEnum.unavailable)
+    if profiles is None:
         profiles = db.query(ConsultantProfile).filter(
             ConsultantProfile.availability != ConsultantEnum.unavailable).all()
-        if not jd or not profiles:
-            print(f"Job Descriptions or Profiles not found for Job ID: {jobDescription_id}")
+        if profiles:
+            for profile in profiles:
+                db.expunge(profile)
+            available_profiles_cache.set(ConsultantEnum.unavailable, profiles)
+    return profiles
+
+
+def _invalidate_after_commit(target, invalidate, *args) -> None:
+    # Mapper events fire during flush, before the change is visible to other sessions; clearing a cache
+    # there lets a concurrent reader re-cache the old rows, so the invalidation waits for the commit
+    object_session(target).info.setdefault("pending_invalidations", set()).add((invalidate, args))
+
+
+@event.listens_for(Session, "after_commit")
+def _run_pending_invalidations(session):
+    for invalidate, args in session.info.pop("pending_invalidations", set()):
+        invalidate(*args)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_invalidations(session, previous_transaction):
+    session.info.pop("pending_invalidations", None)
+
+
+@event.listens_for(JobDescription, "after_update")
+@event.listens_for(JobDescription, "after_delete")
+def _invalidate_job_description(mapper, connection, target):
+    _invalidate_after_commit(target, job_description_cache.pop, target.id)
+
+
+@event.listens_for(ConsultantProfile, "after_insert")
+@event.listens_for(ConsultantProfile, "after_update")
+@event.listens_for(ConsultantProfile, "after_delete")
+def _invalidate_available_profiles(mapper, connection, target):
+    _invalidate_after_commit(target, available_profiles_cache.clear)
+
+
+# Cached top-N payloads embed consultant details and disappear with their job description
+@event.listens_for(JobDescription, "after_delete")
+def _invalidate_job_description_top_matches(mapper, connection, target):
+    _invalidate_after_commit(target, invalidate_top_matches, target.id)
+
+
+@event.listens_for(ConsultantProfile, "after_update")
+@event.listens_for(ConsultantProfile, "after_delete")
+def _invalidate_consultant_top_matches(mapper, connection, target):
+    _invalidate_after_commit(target, invalidate_all_top_matches)
+
+
+# Lambda statements are analysed once and served from the engine's compiled cache on every later call;
+# the closure arguments are extracted as bound parameters.
+def _match_results_stmt(job_description_id: int):
+    return lambda_stmt(
+        lambda: select(*MATCH_RESULT_COLUMNS).where(MatchResult.job_description_id == job_description_id))
+
+
+def _top_match_results_stmt(job_description_id: int, top_n: int):
+    return lambda_stmt(
+        lambda: select(*MATCH_RESULT_COLUMNS)
+        .where(MatchResult.job_description_id == job_description_id)
+        .order_by(MatchResult.rank.asc())
+        .limit(top_n)
+    )
+
+
+def _top_matches_with_profile_stmt(job_description_id: int, top_n: int):
+    return lambda_stmt(
+        lambda: select(*TOP_MATCH_COLUMNS)
+        .outerjoin(ConsultantProfile, MatchResult.consultant_id == ConsultantProfile.id)
+        .where(MatchResult.job_description_id == job_description_id)
+        .order_by(MatchResult.rank.asc())
+        .limit(top_n)
+    )
+
+
+def get_all_match_results(db: db_dependency, background_tasks: BackgroundTasks, jobDescription_id: int) -> dict:
+    """
+    Register a matching workflow for the given Job Description ID and schedule it to run in the background.
+    """
+    try:
+        logger.debug(f"Scheduling match workflow for job description ID: {jobDescription_id}.")
+        # Reject dead requests before any workflow row is written or the agent is scheduled
+        if get_cached_job_description(db, jobDescription_id) is None:
+            logger.warning(f"Job description with ID {jobDescription_id} not found.")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job description not found."
+            )
+        if not get_cached_available_profiles(db):
+            logger.warning(f"No available consultant profiles to match for job description ID: {jobDescription_id}.")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No available consultant profiles found."
+            )
         workflow_status = WorkflowStatus(
             job_description_id=jobDescription_id,
             steps={"jd_parsed": True, "profiles_compared": False},
             progress=WorkflowProgressEnum.PROCESSING,
         )
         db.add(workflow_status)
+        db.flush()
+        # Read the generated id before commit expires the instance, which would cost another SELECT
+        workflow_status_id = workflow_status.id
         db.commit()
+        background_tasks.add_task(process_match_results, jobDescription_id, workflow_status_id)
+        # Runs after matching has finished and delivers the notification it queued
+        background_tasks.add_task(send_pending_notifications, workflow_status_id)
+        logger.info(f"Successfully scheduled match workflow for job description ID: {jobDescription_id}.")
+        return {
+            "job_description_id": jobDescription_id,
+            "workflow_status_id": workflow_status_id,
+            "progress": WorkflowProgressEnum.PROCESSING,
+        }
+    except HTTPException as http_exc:
+        raise http_exc
+    except Exception as e:
+        logger.error(f"Error occurred while scheduling match workflow: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while scheduling the match workflow."
+        )
+
+
+def process_match_results(jobDescription_id: int, workflow_status_id: int) -> None:
+    """
+    Run the agent matching flow, store the ranked matches and notify the requestor.
+    Executed as a background task with its own session, after the response has been sent.
+    """
+    db = sessionLocal()
+    try:
+        logger.debug("Fetching job description and consultant profiles from the database.")
+        jd = get_cached_job_description(db, jobDescription_id)
+        profiles = get_cached_available_profiles(db)
+        if not jd or not profiles:
+            logger.warning(f"Job Descriptions or Profiles not found for Job ID: {jobDescription_id}")
+            _mark_workflow_failed(db, workflow_status_id)
+            return
         logger.debug("Invoking run_agent_matching function.")
         result = run_agent_matching(db, jd, profiles)
         if not result:
-            logger.warning(f"Couldn't start  for  {id} not found fo.")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Workflow status not found."
-            )
-        message = result.get("message")
-        try:
-            send_email(jd.requestor_email, "test", message)
-        except Exception as e:
-            logger.error(f"Error during send email notification agent {e}")
-        workflow_status = db.query(WorkflowStatus).filter(WorkflowStatus.job_description_id == jobDescription_id).first()
-        workflow_status.progress = WorkflowProgressEnum.COMPLETED
-        db.add(workflow_status)
-        db.commit()
+            logger.warning(f"Agent matching returned no result for job description ID: {jobDescription_id}.")
+            _mark_workflow_failed(db, workflow_status_id)
+            return
+        # The row was created by the request; update it in place rather than loading it first
+        db.query(WorkflowStatus).filter(WorkflowStatus.id == workflow_status_id).update(
+            {WorkflowStatus.progress: WorkflowProgressEnum.COMPLETED}, synchronize_session=False)
         all_matches = result.get("all_matches", [])
 
         if not all_matches:
-            print(f"No matches found for job_id: {jobDescription_id}")
+            logger.warning(f"No matches found for job_id: {jobDescription_id}")
 
-        db.query(MatchResult).filter(MatchResult.job_description_id == jobDescription_id).delete()
-        db.commit()
-
-        for idx, match in enumerate(all_matches):
-            matched_profile = MatchResult(
-                rank=idx + 1,
-                job_description_id=jobDescription_id,
-                consultant_id=match["profile"].id,
-                similarity_score=match["similarity_score"]
-
-            )
-            db.add(matched_profile)
-        db.commit()
-        serialized_matches = [
+        rows = [
             {
-                "profile": {
-                    "id": match["profile"].id,
-                    "name": match["profile"].name,
-                    "skills": match["profile"].skills,
-                    "experience": match["profile"].experience,
-                    "location": match["profile"].location,
-                    "availability": match["profile"].availability,
-                },
-                "similarity_score": match["similarity_score"],
                 "rank": idx + 1,
+                "job_description_id": jobDescription_id,
+                "consultant_id": match["profile"].id,
+                "similarity_score": match["similarity_score"],
             }
             for idx, match in enumerate(all_matches)
         ]
+        # Drop ranks that no longer exist and upsert the rest
+        db.query(MatchResult).filter(
+            MatchResult.job_description_id == jobDescription_id,
+            MatchResult.rank > len(rows),
+        ).delete(synchronize_session=False)
+        if rows:
+            upsert = insert(MatchResult).values(rows)
+            upsert = upsert.on_duplicate_key_update(
+                consultant_id=upsert.inserted.consultant_id,
+                similarity_score=upsert.inserted.similarity_score,
+                matched_at=upsert.inserted.matched_at,
+            )
+            db.execute(upsert)
         email_notification = Notification(
             job_description_id=jobDescription_id,
             recipient_email=jd.requestor_email,
-            workflow_status_id=workflow_status.id,
+            workflow_status_id=workflow_status_id,
             email_content=result.get("message"),
-            status="sent",
-            sent_at=datetime.now()
+            status=NotificationStatusEnum.pending,
         )
         db.add(email_notification)
+        # Workflow progress, match results and the queued notification are persisted in one transaction
         db.commit()
-        logger.info("Successfully fetched all match results.")
-        return serialized_matches
+        invalidate_top_matches(jobDescription_id)
+        logger.info(f"Successfully processed match results for job description ID: {jobDescription_id}.")
+    except Exception as e:
+        logger.error(f"Error occurred while processing match results for job description ID {jobDescription_id}: {e}")
+        _mark_workflow_failed(db, workflow_status_id)
+    finally:
+        db.close()
+
 
+def _mark_workflow_failed(db, workflow_status_id: int) -> None:
+    # Move the workflow to a terminal state so clients polling its progress stop waiting
+    try:
+        db.rollback()
+        db.query(WorkflowStatus).filter(WorkflowStatus.id == workflow_status_id).update(
+            {WorkflowStatus.progress: WorkflowProgressEnum.FAILED}, synchronize_session=False)
+        db.commit()
     except Exception as e:
-        logger.error(f"Error occurred while fetching match results: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An error occurred while fetching match results."
-        )
+        db.rollback()
+        logger.error(f"Error occurred while marking workflow status ID {workflow_status_id} as failed: {e}")
 
 
 def get_top_3_matches(db: db_dependency, jd_id: int):
@@ -106,33 +279,25 @@ def get_top_3_matches(db: db_dependency, jd_id: int):
     """
     try:
         logger.debug("Fetching top 3 results with full profile details")
-        top_3_profiles = (
-            db.query(MatchResult)
-            .filter(MatchResult.job_description_id == jd_id)
-            .order_by(MatchResult.rank.asc())
-            .limit(3)
-            .all()
-        )
+        cache_key = top_matches_key(jd_id, "profiles:3")
+        cached = get_cached(cache_key)
+        if cached is not None:
+            return cached
+        # Load each match together with its consultant in a single round-trip
+        top_3_profiles = db.execute(_top_matches_with_profile_stmt(jd_id, 3)).all()
 
-        # Fetch and serialize the full consultant profile for each match
+        # Serialize the full consultant profile for each match
         serialized_results = []
         for profile in top_3_profiles:
-            consultant = db.query(ConsultantProfile).filter(ConsultantProfile.id == profile.consultant_id).first()
-            if consultant:
-                # Handle Enum or str for availability
-                if hasattr(consultant.availability, 'value'):
-                    availability = consultant.availability.value
-                elif hasattr(consultant.availability, 'name'):
-                    availability = consultant.availability.name
-                else:
-                    availability = str(consultant.availability)
+            if profile.consultant_id is not None:
                 consultant_data = {
-                    "id": consultant.id,
-                    "name": consultant.name,
-                    "skills": consultant.skills,
-                    "experience": consultant.experience,
-                    "location": consultant.location,
-                    "availability": availability,
+                    "id": profile.consultant_id,
+                    "name": profile.name,
+                    "skills": profile.skills,
+                    "experience": profile.experience,
+                    "location": profile.location,
+                    # Handle Enum or str for availability
+                    "availability": getattr(profile.availability, 'value', str(profile.availability)),
                 }
             else:
                 consultant_data = None
@@ -143,6 +308,8 @@ def get_top_3_matches(db: db_dependency, jd_id: int):
                 "ranked_at": profile.matched_at.isoformat() if (profile.matched_at is not None) else None,
             })
 
+        if serialized_results:
+            set_cached(cache_key, serialized_results)
         return serialized_results
     except HTTPException as http_exc:
         raise http_exc
@@ -157,7 +324,7 @@ def get_top_3_matches(db: db_dependency, jd_id: int):
 def get_match_result_by_id(db: db_dependency, id: int) -> MatchResultSchema:
     try:
         logger.debug(f"Fetching match result with ID: {id}.")
-        result = db.query(MatchResult).filter(MatchResult.id == id).first()
+        result = db.get(MatchResult, id)
         if not result:
             logger.warning(f"Match result with ID {id} not found.")
             raise HTTPException(
@@ -177,22 +344,33 @@ def get_match_result_by_id(db: db_dependency, id: int) -> MatchResultSchema:
         )
 
 
-def get_match_results_by_job_description_id(db: db_dependency, job_description_id: int) -> list[MatchResultSchema]:
+def get_match_results_by_job_description_id(job_description_id: int) -> Iterator[bytes]:
+    """
+    Return a generator producing the match results of a job description as a JSON array, chunk by chunk.
+    The first batch is fetched and validated up front, so a 404 or a failure surfaces before streaming starts.
+    """
+    # The generator keeps reading while the response is being sent, so it owns its session
+    # instead of borrowing the request's one
+    db = sessionLocal()
     try:
         logger.debug(f"Fetching match results for job description ID: {job_description_id}.")
-        result = db.query(MatchResult).filter(MatchResult.job_description_id == job_description_id).all()
-        if not result:
+        rows = db.execute(_match_results_stmt(job_description_id), execution_options={"yield_per": STREAM_BATCH_SIZE})
+        partitions = rows.partitions()
+        first_batch = next(partitions, None)
+        if not first_batch:
             logger.warning(f"No match results found for job description ID: {job_description_id}.")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No match results found for the given job description ID."
             )
-        match_results = [MatchResultSchema.model_validate(item) for item in result]
-        logger.info(f"Successfully fetched match results for job description ID: {job_description_id}.")
-        return match_results
+        first_results = MATCH_LIST_ADAPTER.validate_python(first_batch, from_attributes=True)
+        logger.info(f"Streaming match results for job description ID: {job_description_id}.")
+        return _stream_match_results(db, job_description_id, first_results, partitions)
     except HTTPException as http_exc:
+        db.close()
         raise http_exc
     except Exception as e:
+        db.close()
         logger.error(f"Error occurred while fetching match results for job description ID {job_description_id}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -200,12 +378,30 @@ def get_match_results_by_job_description_id(db: db_dependency, job_description_i
         )
 
 
+def _stream_match_results(db, job_description_id: int, first_results: list[MatchResultSchema],
+                          partitions: Iterator) -> Iterator[bytes]:
+    try:
+        # Strip the enclosing brackets so batches join into a single JSON array
+        yield b"[" + MATCH_LIST_ADAPTER.dump_json(first_results)[1:-1]
+        for batch in partitions:
+            match_results = MATCH_LIST_ADAPTER.validate_python(batch, from_attributes=True)
+            yield b"," + MATCH_LIST_ADAPTER.dump_json(match_results)[1:-1]
+        yield b"]"
+    except Exception as e:
+        # Headers are already sent; re-raising aborts the response rather than ending it as valid JSON
+        logger.error(f"Error occurred while streaming match results for job description ID {job_description_id}: {e}")
+        raise
+    finally:
+        db.close()
+
+
 def add_match_result(db: db_dependency, match_result_request: MatchResultSchema) -> MatchResultSchema:
     try:
         logger.debug("Attempting to add a new match result.")
         new_match_result = MatchResult(**match_result_request.model_dump())
         db.add(new_match_result)
         db.commit()
+        invalidate_top_matches(new_match_result.job_description_id)
         logger.info("Successfully added a new match result.")
         return MatchResultSchema.model_validate(new_match_result)
     except Exception as e:
@@ -219,17 +415,20 @@ def add_match_result(db: db_dependency, match_result_request: MatchResultSchema)
 def update_match_result_by_id(db: db_dependency, id: int, match_result_request: MatchResultSchema) -> MatchResultSchema:
     try:
         logger.debug(f"Attempting to update match result with ID: {id}.")
-        result = db.query(MatchResult).filter(MatchResult.id == id).first()
-        if not result:
+        # Only the owning job description is read, so its cached top-N results can be invalidated
+        previous = db.query(MatchResult.job_description_id).filter(MatchResult.id == id).first()
+        if not previous:
             logger.warning(f"Match result with ID {id} not found for update.")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Match result not found."
             )
-        for key, value in match_result_request.model_dump().items():
-            setattr(result, key, value)
-        db.add(result)
+        db.query(MatchResult).filter(MatchResult.id == id).update(
+            match_result_request.model_dump(exclude_unset=True), synchronize_session=False)
         db.commit()
+        invalidate_top_matches(previous.job_description_id)
+        invalidate_top_matches(match_result_request.job_description_id)
+        result = db.get(MatchResult, id)
         logger.info(f"Successfully updated match result with ID: {id}.")
         return MatchResultSchema.model_validate(result)
     except HTTPException as http_exc:
@@ -245,15 +444,17 @@ def update_match_result_by_id(db: db_dependency, id: int, match_result_request:
 def delete_match_result_by_id(db: db_dependency, id: int) -> None:
     try:
         logger.debug(f"Attempting to delete match result with ID: {id}.")
-        result = db.query(MatchResult).filter(MatchResult.id == id).first()
+        result = db.get(MatchResult, id)
         if not result:
             logger.warning(f"Match result with ID {id} not found for deletion.")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Match result not found."
             )
+        job_description_id = result.job_description_id
         db.delete(result)
         db.commit()
+        invalidate_top_matches(job_description_id)
         logger.info(f"Successfully deleted match result with ID: {id}.")
     except HTTPException as http_exc:
         raise http_exc
@@ -269,15 +470,19 @@ def get_top_match_results_by_job_description_id(db: db_dependency, job_descripti
     MatchResultSchema]:
     try:
         logger.debug(f"Fetching top {top_n} match results for job description ID: {job_description_id}.")
-        result = db.query(MatchResult).filter(MatchResult.job_description_id == job_description_id).order_by(
-            MatchResult.rank.asc()).limit(top_n).all()
+        cache_key = top_matches_key(job_description_id, top_n)
+        cached = get_cached(cache_key)
+        if cached is not None:
+            return MATCH_LIST_ADAPTER.validate_python(cached)
+        result = db.execute(_top_match_results_stmt(job_description_id, top_n)).all()
         if not result:
             logger.warning(f"No match results found for job description ID: {job_description_id}.")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No match results found for the given job description ID."
             )
-        match_results = [MatchResultSchema.model_validate(item) for item in result]
+        match_results = MATCH_LIST_ADAPTER.validate_python(result, from_attributes=True)
+        set_cached(cache_key, MATCH_LIST_ADAPTER.dump_python(match_results, mode="json"))
         logger.info(f"Successfully fetched top {top_n} match results for job description ID: {job_description_id}.")
         return match_results
     except HTTPException as http_exc:
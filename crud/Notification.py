@@ -1,7 +1,10 @@
 from fastapi import HTTPException, status
-from db.database import db_dependency
+from sqlalchemy import func
+from db.database import db_dependency, sessionLocal
 from model.Notification import Notification  # Assuming this is the ORM model
 from schema.Notification import NotificationSchema, NotificationStatusEnum
+from utility.send_email import send_email
+from datetime import datetime
 import logging
 logger = logging.getLogger(__name__)
 
@@ -24,7 +27,7 @@ def get_all_notifications(db: db_dependency) -> list[NotificationSchema]:
 def get_notification_by_id(db: db_dependency, id: int) -> NotificationSchema:
     try:
         logger.debug(f"Fetching notification with ID: {id}.")
-        result = db.query(Notification).filter(Notification.id == id).first()
+        result = db.get(Notification, id)
         if not result:
             logger.warning(f"Notification with ID {id} not found.")
             raise HTTPException(
@@ -87,7 +90,7 @@ def update_notification_status_by_id(db: db_dependency, id: int,
                                      status_notification: NotificationStatusEnum) -> NotificationSchema:
     try:
         logger.debug(f"Attempting to update status of notification with ID: {id} to {status_notification}.")
-        result = db.query(Notification).filter(Notification.id == id).first()
+        result = db.get(Notification, id)
         if not result:
             logger.warning(f"Notification with ID {id} not found for status update.")
             raise HTTPException(
@@ -114,7 +117,7 @@ def update_notification_status_by_id(db: db_dependency, id: int,
 def delete_notification_by_id(db: db_dependency, id: int) -> None:
     try:
         logger.debug(f"Attempting to delete notification with ID: {id}.")
-        result = db.query(Notification).filter(Notification.id == id).first()
+        result = db.get(Notification, id)
         if not result:
             logger.warning(f"Notification with ID {id} not found for deletion.")
             raise HTTPException(
@@ -156,3 +159,31 @@ def get_notifications_by_status(db: db_dependency, status_notification: Notifica
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while fetching notifications with the given status."
         )
+
+
+def send_pending_notifications(workflow_status_id: int) -> None:
+    """
+    Deliver the pending email notifications of a workflow and record whether each one was sent.
+    Executed as a background task with its own session, so SMTP latency stays off the request path.
+    """
+    db = sessionLocal()
+    try:
+        logger.debug(f"Sending pending notifications for workflow status ID: {workflow_status_id}.")
+        notifications = db.query(Notification).filter(
+            Notification.workflow_status_id == workflow_status_id,
+            Notification.status == NotificationStatusEnum.pending).all()
+        for notification in notifications:
+            try:
+                send_email(notification.recipient_email, "test", notification.email_content)
+                notification.status = NotificationStatusEnum.sent
+                notification.sent_at = func.now()
+            except Exception as e:
+                logger.error(f"Error during send email notification {notification.id}: {e}")
+                notification.status = NotificationStatusEnum.failed
+        db.commit()
+        logger.info(f"Processed {len(notifications)} notification(s) for workflow status ID: {workflow_status_id}.")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error occurred while sending notifications for workflow status ID {workflow_status_id}: {e}")
+    finally:
+        db.close()
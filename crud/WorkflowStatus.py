@@ -25,7 +25,7 @@ def get_all_workflow_statuses(db: db_dependency) -> list[WorkflowStatusSchema]:
 def get_workflow_status_by_id(db: db_dependency, id: int) -> WorkflowStatusSchema:
     try:
         logger.debug(f"Fetching workflow status with ID: {id}.")
-        result = db.query(WorkflowStatus).filter(WorkflowStatus.id == id).first()
+        result = db.get(WorkflowStatus, id)
         if not result:
             logger.warning(f"Workflow status with ID {id} not found.")
             raise HTTPException(
@@ -64,7 +64,7 @@ def add_workflow_status(db: db_dependency, workflow_status_request: WorkflowStat
 def update_workflow_status_by_id(db: db_dependency, id: int, workflow_status_request: WorkflowStatusSchema) -> WorkflowStatusSchema:
     try:
         logger.debug(f"Attempting to update workflow status with ID: {id}.")
-        result = db.query(WorkflowStatus).filter(WorkflowStatus.id == id).first()
+        result = db.get(WorkflowStatus, id)
         if not result:
             logger.warning(f"Workflow status with ID {id} not found for update.")
             raise HTTPException(
@@ -90,7 +90,7 @@ def update_workflow_status_by_id(db: db_dependency, id: int, workflow_status_req
 def delete_workflow_status_by_id(db: db_dependency, id: int) -> None:
     try:
         logger.debug(f"Attempting to delete workflow status with ID: {id}.")
-        result = db.query(WorkflowStatus).filter(WorkflowStatus.id == id).first()
+        result = db.get(WorkflowStatus, id)
         if not result:
             logger.warning(f"Workflow status with ID {id} not found for deletion.")
             raise HTTPException(
@@ -113,7 +113,7 @@ def delete_workflow_status_by_id(db: db_dependency, id: int) -> None:
 def update_workflow_progress(db: db_dependency, id: int, progress: str, steps: dict) -> WorkflowStatusSchema:
     try:
         logger.debug(f"Attempting to update progress of workflow status with ID: {id} to {progress}.")
-        result = db.query(WorkflowStatus).filter(WorkflowStatus.id == id).first()
+        result = db.get(WorkflowStatus, id)
         if not result:
             logger.warning(f"Workflow status with ID {id} not found for progress update.")
             raise HTTPException(
@@ -28,7 +28,7 @@ def get_users(db: db_dependency):
 def get_user_by_id(id: int, db: db_dependency):
     try:
         logger.debug(f"Fetching user with ID: {id}.")
-        user = db.query(UserDetails).filter(UserDetails.id == id).first()
+        user = db.get(UserDetails, id)
         if not user:
             logger.warning(f"User with ID {id} not found.")
             raise HTTPException(
@@ -50,7 +50,7 @@ def get_user_by_id(id: int, db: db_dependency):
 def delete_user_by_id(id: int, db: db_dependency):
     try:
         logger.debug(f"Attempting to delete user with ID: {id}.")
-        user = db.query(UserDetails).filter(UserDetails.id == id).first()
+        user = db.get(UserDetails, id)
         if not user:
             logger.warning(f"User with ID {id} not found for deletion.")
             raise HTTPException(
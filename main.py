@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from db.database import engine
+from sqlalchemy import inspect
 from db.database import base
 from fastapi.middleware.cors import CORSMiddleware  # Import the logger from your logging configuration file
 
@@ -33,6 +34,13 @@ app.add_middleware(
 base.metadata.create_all(bind=engine)
 logger.info("Database tables created successfully")  # Log database initialization
 
+# create_all never alters an existing table; without this constraint the match result upsert
+# would insert duplicate ranks instead of updating them
+if "uq_matches_job_description_rank" not in {
+    constraint["name"] for constraint in inspect(engine).get_unique_constraints("matches")
+}:
+    raise RuntimeError("The matches table is missing uq_matches_job_description_rank; run `alembic upgrade head`.")
+
 # Include routers with prefixes
 app.include_router(user_router, prefix="/api/user", tags=["User"])
 logger.info("User router included successfully")  # Log router inclusion
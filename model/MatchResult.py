@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, DateTime, Integer, ForeignKey
+from sqlalchemy import Column, String, Float, DateTime, Integer, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from db.database import base
 from datetime import datetime
@@ -6,6 +6,11 @@ from datetime import datetime
 class MatchResult(base):
     __tablename__ = 'matches'
     __allow_unmapped__ = True
+    __table_args__ = (
+        # Also serves as the (job_description_id, rank) index for the ordered top-N reads and,
+        # through its leftmost column, for the per-job delete path
+        UniqueConstraint("job_description_id", "rank", name="uq_matches_job_description_rank"),
+    )
 
     id = Column(Integer, primary_key=True)  # UUID
     job_description_id = Column(ForeignKey("job_descriptions.id"))  # foreign key to job_descriptions.id
@@ -13,7 +13,7 @@ router = APIRouter()
 
 # GET all consultant profiles
 @router.get("/", status_code=status.HTTP_200_OK)
-async def read_all_consultant_profiles(user: Annotated[dict, Depends(get_current_user)], db: db_dependency):
+def read_all_consultant_profiles(user: Annotated[dict, Depends(get_current_user)], db: db_dependency):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -31,7 +31,7 @@ async def read_all_consultant_profiles(user: Annotated[dict, Depends(get_current
 
 # GET consultant profile by ID
 @router.get("/{consultant_profile_id}", status_code=status.HTTP_200_OK)
-async def read_consultant_profile_by_id(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, consultant_profile_id: int = Path(...)):
+def read_consultant_profile_by_id(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, consultant_profile_id: int = Path(...)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -51,7 +51,7 @@ async def read_consultant_profile_by_id(user: Annotated[dict, Depends(get_curren
 
 # GET consultant profiles by skill
 @router.get("/search", status_code=status.HTTP_200_OK)
-async def read_consultant_profiles_by_skill(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, skill: str = Query(...)):
+def read_consultant_profiles_by_skill(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, skill: str = Query(...)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -71,7 +71,7 @@ async def read_consultant_profiles_by_skill(user: Annotated[dict, Depends(get_cu
 
 # POST a new consultant profile
 @router.post("/", status_code=status.HTTP_201_CREATED)
-async def create_consultant_profile(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, consultant_profile_request: ConsultantProfileSchema):
+def create_consultant_profile(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, consultant_profile_request: ConsultantProfileSchema):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -87,7 +87,7 @@ async def create_consultant_profile(user: Annotated[dict, Depends(get_current_us
         )
 
 @router.post("/upload-pdfs/", status_code=status.HTTP_200_OK)
-async def upload_multiple_pdfs(db: db_dependency,files: list[UploadFile] = File(...)):
+def upload_multiple_pdfs(db: db_dependency,files: list[UploadFile] = File(...)):
     """
     Endpoint to upload multiple PDF files and process their content.
     """
@@ -131,7 +131,7 @@ async def upload_multiple_pdfs(db: db_dependency,files: list[UploadFile] = File(
 
 # PUT to update consultant profile by ID
 @router.put("/{consultant_profile_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def update_consultant_profile(
+def update_consultant_profile(
     user: Annotated[dict, Depends(get_current_user)],
     db: db_dependency,
     consultant_profile_request: ConsultantProfileSchema,
@@ -155,7 +155,7 @@ async def update_consultant_profile(
 
 # DELETE consultant profile by ID
 @router.delete("/{consultant_profile_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_consultant_profile(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, consultant_profile_id: int = Path(...)):
+def delete_consultant_profile(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, consultant_profile_id: int = Path(...)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -174,7 +174,7 @@ async def delete_consultant_profile(user: Annotated[dict, Depends(get_current_us
 
 # PUT to update consultant availability
 @router.put("/{consultant_profile_id}/availability", status_code=status.HTTP_200_OK)
-async def update_consultant_availability(
+def update_consultant_availability(
     user: Annotated[dict, Depends(get_current_user)],
     db: db_dependency,
     consultant_profile_id: int = Path(...),
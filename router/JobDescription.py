@@ -14,7 +14,7 @@ router = APIRouter()
 
 # GET all job descriptions
 @router.get("/", response_model=list[JobDescriptionRequestorOutput], status_code=status.HTTP_200_OK)
-async def read_all_job_descriptions(user: Annotated[dict, Depends(get_current_user)], db: db_dependency):
+def read_all_job_descriptions(user: Annotated[dict, Depends(get_current_user)], db: db_dependency):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -32,8 +32,8 @@ async def read_all_job_descriptions(user: Annotated[dict, Depends(get_current_us
 
 # GET job descriptions by title
 @router.get("/searching_by_title/", status_code=status.HTTP_200_OK)
-async def read_job_descriptions_by_title(user: Annotated[dict, Depends(get_current_user)], db: db_dependency,
-                                         title: str = Query(...)):
+def read_job_descriptions_by_title(user: Annotated[dict, Depends(get_current_user)], db: db_dependency,
+                                   title: str = Query(...)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -53,8 +53,8 @@ async def read_job_descriptions_by_title(user: Annotated[dict, Depends(get_curre
 
 # GET job description by ID
 @router.get("/{job_description_id}", status_code=status.HTTP_200_OK)
-async def read_job_description_by_id(user: Annotated[dict, Depends(get_current_user)], db: db_dependency,
-                                     job_description_id: int = Path(...)):
+def read_job_description_by_id(user: Annotated[dict, Depends(get_current_user)], db: db_dependency,
+                               job_description_id: int = Path(...)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -74,8 +74,8 @@ async def read_job_description_by_id(user: Annotated[dict, Depends(get_current_u
 
 # POST a new job description
 @router.post("/", status_code=status.HTTP_201_CREATED)
-async def create_job_description(user: Annotated[dict, Depends(get_current_user)], db: db_dependency,
-                                 job_description_request: JobDescriptionRequest):
+def create_job_description(user: Annotated[dict, Depends(get_current_user)], db: db_dependency,
+                           job_description_request: JobDescriptionRequest):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -94,7 +94,7 @@ async def create_job_description(user: Annotated[dict, Depends(get_current_user)
 
 
 @router.post("/upload-job-descriptions/", status_code=status.HTTP_200_OK)
-async def upload_job_descriptions(
+def upload_job_descriptions(
         user: Annotated[dict, Depends(get_current_user)],
         db: db_dependency,
         files: list[UploadFile] = File(...)
@@ -153,7 +153,7 @@ async def upload_job_descriptions(
 
 # PUT to update job description by ID
 @router.put("/{job_description_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def update_job_description(
+def update_job_description(
         user: Annotated[dict, Depends(get_current_user)],
         db: db_dependency,
         job_description_request: JobDescriptionRequest,
@@ -177,8 +177,8 @@ async def update_job_description(
 
 # DELETE job description by ID
 @router.delete("/{job_description_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_job_description(user: Annotated[dict, Depends(get_current_user)], db: db_dependency,
-                                 job_description_id: int = Path()):
+def delete_job_description(user: Annotated[dict, Depends(get_current_user)], db: db_dependency,
+                           job_description_id: int = Path()):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -197,7 +197,7 @@ async def delete_job_description(user: Annotated[dict, Depends(get_current_user)
 
 # PUT to update job description status
 @router.put("/{job_description_id}/status", status_code=status.HTTP_200_OK)
-async def update_job_description_status(
+def update_job_description_status(
         user: Annotated[dict, Depends(get_current_user)],
         db: db_dependency,
         job_description_id: int = Path(...),
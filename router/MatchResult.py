@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, status, HTTPException, Query, Path
+from fastapi import APIRouter, BackgroundTasks, Depends, status, HTTPException, Query, Path
+from fastapi.responses import Response, StreamingResponse
+from pydantic_core import to_json
 from crud import MatchResult as match_result_service
 from db.database import db_dependency
 from schema.MatchResult import MatchResultSchema
@@ -9,35 +11,37 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-# GET all match results
-@router.get("/all-matches/{job_description_id}", status_code=status.HTTP_200_OK)
-async def get_all_match_results(user: Annotated[dict, Depends(get_current_user)], job_description_id: int,
-                                db: db_dependency):
+# GET all match results (matching runs in the background; poll the workflow status for progress)
+@router.get("/all-matches/{job_description_id}", status_code=status.HTTP_202_ACCEPTED)
+def get_all_match_results(user: Annotated[dict, Depends(get_current_user)], job_description_id: int,
+                          db: db_dependency, background_tasks: BackgroundTasks):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
-        logger.debug("Fetching all match results.")
-        match_results = match_result_service.get_all_match_results(db, job_description_id)
-        logger.info("Successfully fetched all match results.")
-        return match_results
+        logger.debug("Scheduling match workflow.")
+        workflow = match_result_service.get_all_match_results(db, background_tasks, job_description_id)
+        logger.info("Successfully scheduled match workflow.")
+        return workflow
+    except HTTPException as http_exc:
+        raise http_exc
     except Exception as e:
-        logger.error(f"Error occurred while fetching match results: {e}")
+        logger.error(f"Error occurred while scheduling match workflow: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An error occurred while fetching match results."
+            detail="An error occurred while scheduling the match workflow."
         )
 
 
 @router.get("/top-3-matches/{job_description_id}", status_code=status.HTTP_200_OK)
-async def top_3_match_results(user: Annotated[dict, Depends(get_current_user)], job_description_id: int,
-                              db: db_dependency):
+def top_3_match_results(user: Annotated[dict, Depends(get_current_user)], job_description_id: int,
+                        db: db_dependency):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
         logger.debug("Fetching top 3 match results.")
         match_results = match_result_service.get_top_3_matches(db, job_description_id)
         logger.info("Successfully fetched top 3 match results.")
-        return match_results
+        return Response(content=to_json(match_results), media_type="application/json")
     except Exception as e:
         logger.error(f"Error occurred while fetching top 3 match results: {e}")
         raise HTTPException(
@@ -48,8 +52,8 @@ async def top_3_match_results(user: Annotated[dict, Depends(get_current_user)],
 
 # GET match result by ID
 @router.get("/{match_result_id}", status_code=status.HTTP_200_OK)
-async def read_match_result_by_id(user: Annotated[dict, Depends(get_current_user)], db: db_dependency,
-                                  match_result_id: int = Path(...)):
+def read_match_result_by_id(user: Annotated[dict, Depends(get_current_user)], db: db_dependency,
+                            match_result_id: int = Path(...)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -69,15 +73,15 @@ async def read_match_result_by_id(user: Annotated[dict, Depends(get_current_user
 
 # GET match results by job description ID
 @router.get("/job/{job_description_id}", status_code=status.HTTP_200_OK)
-async def read_match_results_by_job_description_id(user: Annotated[dict, Depends(get_current_user)], db: db_dependency,
-                                                   job_description_id: int = Path(...)):
+def read_match_results_by_job_description_id(user: Annotated[dict, Depends(get_current_user)],
+                                             job_description_id: int = Path(...)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
         logger.debug(f"Fetching match results for job description ID: {job_description_id}.")
-        match_results = match_result_service.get_match_results_by_job_description_id(db, job_description_id)
+        match_results = match_result_service.get_match_results_by_job_description_id(job_description_id)
         logger.info(f"Successfully fetched match results for job description ID: {job_description_id}.")
-        return match_results
+        return StreamingResponse(match_results, media_type="application/json")
     except HTTPException as http_exc:
         raise http_exc
     except Exception as e:
@@ -90,7 +94,7 @@ async def read_match_results_by_job_description_id(user: Annotated[dict, Depends
 
 # GET top N match results by job description ID
 @router.get("/job/{job_description_id}/top", status_code=status.HTTP_200_OK)
-async def read_top_match_results_by_job_description_id(
+def read_top_match_results_by_job_description_id(
         user: Annotated[dict, Depends(get_current_user)],
         db: db_dependency,
         job_description_id: int = Path(...),
@@ -102,7 +106,7 @@ async def read_top_match_results_by_job_description_id(
         logger.debug(f"Fetching top {top_n} match results for job description ID: {job_description_id}.")
         match_results = match_result_service.get_top_match_results_by_job_description_id(db, job_description_id, top_n)
         logger.info(f"Successfully fetched top {top_n} match results for job description ID: {job_description_id}.")
-        return match_results
+        return Response(content=to_json(match_results), media_type="application/json")
     except HTTPException as http_exc:
         raise http_exc
     except Exception as e:
@@ -116,8 +120,8 @@ async def read_top_match_results_by_job_description_id(
 
 # POST a new match result
 @router.post("/", status_code=status.HTTP_201_CREATED)
-async def create_match_result(user: Annotated[dict, Depends(get_current_user)], db: db_dependency,
-                              match_result_request: MatchResultSchema):
+def create_match_result(user: Annotated[dict, Depends(get_current_user)], db: db_dependency,
+                        match_result_request: MatchResultSchema):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -135,7 +139,7 @@ async def create_match_result(user: Annotated[dict, Depends(get_current_user)],
 
 # PUT to update match result by ID
 @router.put("/{match_result_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def update_match_result(
+def update_match_result(
         user: Annotated[dict, Depends(get_current_user)],
         db: db_dependency,
         match_result_request: MatchResultSchema,
@@ -159,8 +163,8 @@ async def update_match_result(
 
 # DELETE match result by ID
 @router.delete("/{match_result_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_match_result(db: db_dependency, user: Annotated[dict, Depends(get_current_user)],
-                              match_result_id: int = Path(...)):
+def delete_match_result(db: db_dependency, user: Annotated[dict, Depends(get_current_user)],
+                        match_result_id: int = Path(...)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -11,7 +11,7 @@ router = APIRouter()
 
 # GET all notifications
 @router.get("/", status_code=status.HTTP_200_OK)
-async def read_all_notifications(user: Annotated[dict, Depends(get_current_user)], db: db_dependency):
+def read_all_notifications(user: Annotated[dict, Depends(get_current_user)], db: db_dependency):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -29,7 +29,7 @@ async def read_all_notifications(user: Annotated[dict, Depends(get_current_user)
 
 # GET notification by ID
 @router.get("/{notification_id}", status_code=status.HTTP_200_OK)
-async def read_notification_by_id(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, notification_id: int = Path(...)):
+def read_notification_by_id(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, notification_id: int = Path(...)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -49,7 +49,7 @@ async def read_notification_by_id(user: Annotated[dict, Depends(get_current_user
 
 # GET notifications by job description ID
 @router.get("/job/{job_description_id}", status_code=status.HTTP_200_OK)
-async def read_notifications_by_job_description_id(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, job_description_id: int = Path(...)):
+def read_notifications_by_job_description_id(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, job_description_id: int = Path(...)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -69,7 +69,7 @@ async def read_notifications_by_job_description_id(user: Annotated[dict, Depends
 
 # GET notifications by status
 @router.get("/status/{status}", status_code=status.HTTP_200_OK)
-async def read_notifications_by_status(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, status_notification: NotificationStatusEnum = Path(...)):
+def read_notifications_by_status(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, status_notification: NotificationStatusEnum = Path(...)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -89,7 +89,7 @@ async def read_notifications_by_status(user: Annotated[dict, Depends(get_current
 
 # POST a new notification
 @router.post("/", status_code=status.HTTP_201_CREATED)
-async def create_notification(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, notification_request: NotificationSchema):
+def create_notification(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, notification_request: NotificationSchema):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -107,7 +107,7 @@ async def create_notification(user: Annotated[dict, Depends(get_current_user)],
 
 # PUT to update notification status by ID
 @router.put("/{notification_id}/status", status_code=status.HTTP_200_OK)
-async def update_notification_status(
+def update_notification_status(
     user: Annotated[dict, Depends(get_current_user)],
     db: db_dependency,
     notification_id: int = Path(...),
@@ -132,7 +132,7 @@ async def update_notification_status(
 
 # DELETE notification by ID
 @router.delete("/{notification_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_notification(user: Annotated[dict, Depends(get_current_user)],db: db_dependency, notification_id: int = Path(...)):
+def delete_notification(user: Annotated[dict, Depends(get_current_user)],db: db_dependency, notification_id: int = Path(...)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -12,7 +12,7 @@ router = APIRouter()
 
 # GET all workflow statuses
 @router.get("/", status_code=status.HTTP_200_OK)
-async def read_all_workflow_statuses(user: Annotated[dict, Depends(get_current_user)], db: db_dependency):
+def read_all_workflow_statuses(user: Annotated[dict, Depends(get_current_user)], db: db_dependency):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -30,7 +30,7 @@ async def read_all_workflow_statuses(user: Annotated[dict, Depends(get_current_u
 
 # GET workflow status by ID
 @router.get("/{workflow_status_id}", status_code=status.HTTP_200_OK)
-async def read_workflow_status_by_id(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, workflow_status_id: int = Path(...)):
+def read_workflow_status_by_id(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, workflow_status_id: int = Path(...)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -50,7 +50,7 @@ async def read_workflow_status_by_id(user: Annotated[dict, Depends(get_current_u
 
 # POST a new workflow status
 @router.post("/", status_code=status.HTTP_201_CREATED)
-async def create_workflow_status(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, workflow_status_request: WorkflowStatusSchema):
+def create_workflow_status(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, workflow_status_request: WorkflowStatusSchema):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -68,7 +68,7 @@ async def create_workflow_status(user: Annotated[dict, Depends(get_current_user)
 
 # PUT to update workflow status by ID
 @router.put("/{workflow_status_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def update_workflow_status(
+def update_workflow_status(
     user: Annotated[dict, Depends(get_current_user)],
     db: db_dependency,
     workflow_status_request: WorkflowStatusSchema,
@@ -92,7 +92,7 @@ async def update_workflow_status(
 
 # DELETE workflow status by ID
 @router.delete("/{workflow_status_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_workflow_status(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, workflow_status_id: int = Path(...)):
+def delete_workflow_status(user: Annotated[dict, Depends(get_current_user)], db: db_dependency, workflow_status_id: int = Path(...)):
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
     try:
@@ -111,7 +111,7 @@ async def delete_workflow_status(user: Annotated[dict, Depends(get_current_user)
 
 # PUT to update workflow progress
 @router.put("/{workflow_status_id}/progress", status_code=status.HTTP_200_OK)
-async def update_workflow_progress(
+def update_workflow_progress(
     user: Annotated[dict, Depends(get_current_user)],
     db: db_dependency,
     steps: dict,
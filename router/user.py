@@ -17,7 +17,7 @@ router = APIRouter()
 
 # GET method
 @router.get("/", status_code=status.HTTP_200_OK)
-async def read_all(db: db_dependency):
+def read_all(db: db_dependency):
     try:
         logger.debug("Fetching all users.")
         users = user_service.get_users(db)
@@ -33,7 +33,7 @@ async def read_all(db: db_dependency):
 
 # POST method
 @router.post("/user_details", status_code=status.HTTP_201_CREATED)
-async def create_user(user_details_request: UserDetailsRequest, db: db_dependency):
+def create_user(user_details_request: UserDetailsRequest, db: db_dependency):
     try:
         logger.debug("Creating a new user.")
         user_service.add_user(user_details_request, db)
@@ -48,7 +48,7 @@ async def create_user(user_details_request: UserDetailsRequest, db: db_dependenc
 
 # PUT method
 @router.put("/user_details/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def update_user_details(db: db_dependency, user_details_request: UserDetailsRequest, user_id: int = Path(gt=0)):
+def update_user_details(db: db_dependency, user_details_request: UserDetailsRequest, user_id: int = Path(gt=0)):
     try:
         logger.debug(f"Updating user details for user ID: {user_id}.")
         user_service.update_user_by_id(user_id, user_details_request, db)
@@ -65,7 +65,7 @@ async def update_user_details(db: db_dependency, user_details_request: UserDetai
 
 # DELETE method
 @router.delete("/user_details/delete", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user_details(db: db_dependency, user_id: str = Query()):
+def delete_user_details(db: db_dependency, user_id: str = Query()):
     try:
         logger.debug(f"Deleting user with ID: {user_id}.")
         user_details_model = user_service.get_user_by_id(user_id, db)
@@ -87,14 +87,14 @@ async def delete_user_details(db: db_dependency, user_id: str = Query()):
 
 # Login method
 @router.post("/token", response_model=Token)
-async def login_form(form_data: Annotated[OAuth2PasswordRequestForm, Depends()], db: db_dependency):
+def login_form(form_data: Annotated[OAuth2PasswordRequestForm, Depends()], db: db_dependency):
     try:
         logger.debug(f"Authenticating user with username: {form_data.username}.")
-        user = await security.authenticate_user(form_data.username, form_data.password, db)
+        user = security.authenticate_user(form_data.username, form_data.password, db)
         if not user:
             logger.warning(f"Authentication failed for username: {form_data.username}.")
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is not authorized")
-        token = await security.create_access_token(user.email, user.id, timedelta(minutes=20), db)
+        token = security.create_access_token(user.email, user.id, timedelta(minutes=20), db)
         logger.info(f"Successfully authenticated user: {form_data.username}.")
         return {'access_token': token, 'token_type': 'bearer'}
     except HTTPException as http_exc:
@@ -109,7 +109,7 @@ async def login_form(form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 
 # Verify Email method
 @router.post("/verify-email", status_code=status.HTTP_200_OK)
-async def verify_email(email: str, db: db_dependency):
+def verify_email(email: str, db: db_dependency):
     try:
         logger.debug(f"Verifying email: {email}.")
         user = db.query(UserDetails).filter(UserDetails.email == email).first()
@@ -130,7 +130,7 @@ async def verify_email(email: str, db: db_dependency):
 
 # Reset Password method
 @router.put("/reset-password", status_code=status.HTTP_200_OK)
-async def reset_password(email: str, new_password: str, db: db_dependency):
+def reset_password(email: str, new_password: str, db: db_dependency):
     try:
         logger.debug(f"Resetting password for email: {email}.")
         user = db.query(UserDetails).filter(UserDetails.email == email).first()
@@ -0,0 +1,117 @@
+import json
+import logging
+import os
+import threading
+import time
+import redis
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL")
+TOP_MATCHES_CACHE_TTL = int(os.getenv("TOP_MATCHES_CACHE_TTL", 300))
+# Keep these short: an unreachable Redis must turn into a quick cache miss, not a hung request
+REDIS_SOCKET_CONNECT_TIMEOUT = float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", 0.5))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", 0.5))
+
+# Caching is switched off when no Redis server is configured; every lookup is then a miss
+cache_client = redis.Redis.from_url(
+    REDIS_URL,
+    socket_connect_timeout=REDIS_SOCKET_CONNECT_TIMEOUT,
+    socket_timeout=REDIS_SOCKET_TIMEOUT,
+) if REDIS_URL else None
+
+
+def top_matches_key(job_description_id: int, suffix) -> str:
+    return f"top:{job_description_id}:{suffix}"
+
+
+def get_cached(key: str):
+    """
+    Return the JSON-decoded value stored under key, or None on a miss or when Redis is not configured.
+    """
+    if cache_client is None:
+        return None
+    try:
+        raw = cache_client.get(key)
+    except redis.RedisError as e:
+        logger.error(f"Error reading cache key {key}: {e}")
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+def set_cached(key: str, value, ttl: int = TOP_MATCHES_CACHE_TTL) -> None:
+    if cache_client is None:
+        return
+    try:
+        cache_client.set(key, json.dumps(value), ex=ttl)
+    except redis.RedisError as e:
+        logger.error(f"Error writing cache key {key}: {e}")
+
+
+def invalidate_top_matches(job_description_id: int) -> None:
+    """
+    Drop every cached top-N result of a job description.
+    """
+    if cache_client is None:
+        return
+    try:
+        keys = list(cache_client.scan_iter(match=top_matches_key(job_description_id, "*")))
+        if keys:
+            cache_client.delete(*keys)
+    except redis.RedisError as e:
+        logger.error(f"Error invalidating cached matches for job description ID {job_description_id}: {e}")
+
+
+def invalidate_all_top_matches() -> None:
+    """
+    Drop the cached top-N results of every job description.
+    """
+    if cache_client is None:
+        return
+    try:
+        keys = list(cache_client.scan_iter(match="top:*"))
+        if keys:
+            cache_client.delete(*keys)
+    except redis.RedisError as e:
+        logger.error(f"Error invalidating cached matches: {e}")
+
+
+class LocalTTLCache:
+    """
+    Small thread-safe, process-local cache whose entries expire ttl seconds after being set.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                # Evict the entry closest to expiry to make room
+                del self._data[min(self._data, key=lambda k: self._data[k][0])]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()